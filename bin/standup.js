@@ -102,6 +102,7 @@ function loadConfig() {
         format: data.format,
         team: data.team,
         copy: parseBool(data.copy, true),
+        stats: parseBool(data.stats, true),
         repos: normalizeRepos(data.repos),
       };
       if (Object.prototype.hasOwnProperty.call(data, 'no_copy')) {
@@ -159,23 +160,23 @@ function parseGitLogWithNumstat(raw) {
   return commits;
 }
 
-function getRepoSummary(repoPath) {
+function getRepoSummary(repoPath, stats = true) {
   const absPath = path.resolve(repoPath);
   const repoName = path.basename(absPath) || absPath;
+  const args = [
+    '-C',
+    absPath,
+    'log',
+    '--since=24 hours ago',
+    '--no-merges',
+    '--pretty=format:__COMMIT__%x1f%s',
+  ];
+  if (stats) args.push('--numstat');
   try {
-    const raw = execFileSync(
-      'git',
-      [
-        '-C',
-        absPath,
-        'log',
-        '--since=24 hours ago',
-        '--no-merges',
-        '--pretty=format:__COMMIT__%x1f%s',
-        '--numstat',
-      ],
-      { encoding: 'utf8', stdio: ['ignore', 'pipe', 'pipe'] }
-    ).trim();
+    const raw = execFileSync('git', args, {
+      encoding: 'utf8',
+      stdio: ['ignore', 'pipe', 'pipe'],
+    }).trim();
 
     const commits = parseGitLogWithNumstat(raw);
     return {
@@ -183,7 +184,9 @@ function getRepoSummary(repoPath) {
       path: absPath,
       commits,
       commit_count: commits.length,
-      files_changed: commits.reduce((sum, cmt) => sum + cmt.files_changed, 0),
+      files_changed: stats
+        ? commits.reduce((sum, cmt) => sum + cmt.files_changed, 0)
+        : null,
     };
   } catch (err) {
     const rawStderr = Buffer.isBuffer(err?.stderr) ? err.stderr.toString('utf8') : String(err?.stderr || '');
@@ -241,9 +244,9 @@ function formatOutput({ repoSummaries, today, blockers, format, team }) {
   }
 
   for (const repo of repoSummaries) {
-    repoLines.push(
-      `${repo.name} (${repo.commit_count} commits, ${repo.files_changed} files changed):`
-    );
+    let counts = `${repo.commit_count} commits`;
+    if (repo.files_changed !== null) counts += `, ${repo.files_changed} files changed`;
+    repoLines.push(`${repo.name} (${counts}):`);
     repoLines.push(...summarizeCommits(repo.commits));
     repoLines.push('');
   }
@@ -331,6 +334,7 @@ function parseArgs(argv) {
     format: null,
     team: null,
     noCopy: false,
+    stats: null,
     repos: [],
   };
 
@@ -355,6 +359,14 @@ function parseArgs(argv) {
       parsed.noCopy = true;
       continue;
     }
+    if (arg === '--stats') {
+      parsed.stats = true;
+      continue;
+    }
+    if (arg === '--no-stats') {
+      parsed.stats = false;
+      continue;
+    }
     if (arg === '--help' || arg === '-h') {
       printHelp();
       process.exit(0);
@@ -370,13 +382,15 @@ function printHelp() {
     'standup-cli',
     '',
     'Usage:',
-    '  standup [--format plain|slack|markdown] [--team "Team Name"] [--repo <path>] [--no-copy]',
+    '  standup [--format plain|slack|markdown] [--team "Team Name"] [--repo <path>] [--no-copy] [--no-stats]',
     '',
     'Options:',
     '  -f, --format   Output format (plain, slack, markdown)',
     '  -t, --team     Team name for standup header',
     '  --repo         Repository path to scan (repeatable)',
     '  --no-copy      Disable clipboard auto-copy',
+    '  --stats        Count files changed per repository (default)',
+    '  --no-stats     Skip files-changed counting for a faster scan',
     '  -h, --help     Show help',
     '',
   ];
@@ -402,6 +416,8 @@ async function main() {
 
   const team = cli.team || config.team || null;
   const copyEnabled = !cli.noCopy && (config.copy !== undefined ? config.copy : true);
+  let statsEnabled = config.stats !== undefined ? config.stats : true;
+  if (cli.stats !== null) statsEnabled = cli.stats;
   const repoPaths = collectRepoPaths(config.repos || [], cli.repos);
 
   console.log('');
@@ -413,7 +429,7 @@ async function main() {
   const skipped = [];
   const dubious = [];
   for (const repoPath of repoPaths) {
-    const summary = getRepoSummary(repoPath);
+    const summary = getRepoSummary(repoPath, statsEnabled);
     if (!summary) {
       skipped.push(repoPath);
       continue;
@@ -425,12 +441,11 @@ async function main() {
       continue;
     }
     repoSummaries.push(summary);
-    console.log(
-      paint(
-        c.green,
-        `  ${summary.name}: ${summary.commit_count} commit(s), ${summary.files_changed} file(s) changed`
-      )
-    );
+    let scanLine = `  ${summary.name}: ${summary.commit_count} commit(s)`;
+    if (summary.files_changed !== null) {
+      scanLine += `, ${summary.files_changed} file(s) changed`;
+    }
+    console.log(paint(c.green, scanLine));
   }
   for (const issue of dubious) {
     if (issue.error === 'dubious_ownership') {
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
+import functools
 import os
 import re
-import shutil
 import subprocess
 import sys
+import time
 
 # ANSI colors
 RESET = "\x1b[0m"
@@ -18,6 +18,17 @@ YELLOW = "\x1b[33m"
 MAGENTA = "\x1b[35m"
 GRAY = "\x1b[90m"
 
+# Static, pre-painted terminal strings.
+BANNER = f"{BOLD}{CYAN}  standup-cli{RESET}"
+TAGLINE = f"{GRAY}  Generate your daily standup in seconds\n{RESET}"
+SCANNING = f"{DIM}  Scanning git commits from last 24hrs...{RESET}"
+TODAY_PROMPT = f"{BOLD}  What are you working on today?\n  {RESET}> "
+BLOCKERS_PROMPT = f'{BOLD}  Any blockers? (press Enter for "None")\n  {RESET}> '
+DIVIDER = f"{GRAY}  {'-' * 50}{RESET}"
+TIP = f"{GRAY}  Tip: use --format slack | markdown | plain{RESET}"
+COPIED = f"{GREEN}  Copied standup to clipboard{RESET}"
+COPY_UNAVAILABLE = f"{YELLOW}  Warning: clipboard copy unavailable{RESET}"
+
 TYPE_ORDER = [
     "feat",
     "fix",
@@ -46,6 +57,25 @@ TYPE_LABELS = {
     "other": "Other",
 }
 
+TYPE_SET = frozenset(TYPE_ORDER)
+TYPE_TABLE = tuple((ctype, TYPE_LABELS[ctype]) for ctype in TYPE_ORDER)
+
+COMMIT_MARKER = "__COMMIT__\x1f"
+
+SHORTSTAT_RE = re.compile(r"\s*(\d+) files? changed")
+
+SUBJECT_RE = re.compile(
+    r"^(?P<type>[a-zA-Z]+)(\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s*(?P<msg>.+)$"
+)
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "standup-cli",
+)
+CACHE_VERSION = 2
+CACHE_COMMIT_KEYS = frozenset(("type", "message", "timestamp", "files_changed"))
+SINCE_SECONDS = 24 * 60 * 60
+
 
 def paint(color, text):
     return f"{color}{text}{RESET}"
@@ -74,20 +104,28 @@ def normalize_repos(value):
     return []
 
 
-def load_config():
+@functools.lru_cache(maxsize=1)
+def read_config():
     paths = [
         os.path.join(os.getcwd(), ".standuprc"),
         os.path.join(os.path.expanduser("~"), ".standuprc"),
     ]
     for path in paths:
-        if not os.path.isfile(path):
-            continue
         try:
             with open(path, "r", encoding="utf-8") as handle:
                 raw = handle.read().strip()
+        except OSError:
+            # Missing, a directory (PermissionError rather than
+            # IsADirectoryError on Windows) or unreadable: try the next one.
+            continue
+        except Exception:
+            return {}
+        try:
             if not raw:
                 return {}
-            if raw.lstrip().startswith("{"):
+            if raw[0] == "{":
+                import json
+
                 data = json.loads(raw)
             else:
                 data = {}
@@ -103,6 +141,7 @@ def load_config():
             config["copy"] = parse_bool(data.get("copy"), True)
             if "no_copy" in data:
                 config["copy"] = not parse_bool(data.get("no_copy"), False)
+            config["stats"] = parse_bool(data.get("stats"), True)
             config["repos"] = normalize_repos(data.get("repos"))
             return config
         except Exception:
@@ -110,16 +149,43 @@ def load_config():
     return {}
 
 
+def load_config():
+    # read_config is memoized, so hand out a copy that callers may modify.
+    config = dict(read_config())
+    if "repos" in config:
+        config["repos"] = list(config["repos"])
+    return config
+
+
+def split_commit_subject(subject):
+    head, sep, rest = subject.partition(":")
+    if not sep:
+        return None
+    msg = rest.strip()
+    if head.endswith("!"):
+        head = head[:-1]
+    scope = None
+    valid = True
+    if head.endswith(")"):
+        start = head.find("(")
+        scope = head[start + 1 : -1]
+        head = head[:start]
+        valid = start > 0 and scope != "" and ")" not in scope
+    if valid and msg and "\n" not in msg and head.isascii() and head.isalpha():
+        return head, scope, msg
+    # Rare shapes (e.g. a colon inside the scope) go through the full regex.
+    match = SUBJECT_RE.match(subject)
+    if match:
+        return match.group("type"), match.group("scope"), match.group("msg").strip()
+    return None
+
+
 def parse_commit_subject(subject):
     subject = subject.strip()
-    match = re.match(
-        r"^(?P<type>[a-zA-Z]+)(\((?P<scope>[^)]+)\))?(?P<breaking>!)?:\s*(?P<msg>.+)$",
-        subject,
-    )
-    if match:
-        ctype = match.group("type").lower()
-        scope = match.group("scope")
-        msg = match.group("msg").strip()
+    parts = split_commit_subject(subject)
+    if parts:
+        ctype, scope, msg = parts
+        ctype = ctype.lower()
     else:
         ctype = "other"
         scope = None
@@ -132,193 +198,317 @@ def parse_commit_subject(subject):
     return {"type": ctype, "message": msg}
 
 
-def parse_git_log_with_numstat(raw):
-    commits = []
+def parse_git_log_with_shortstat(lines):
     current = None
-    for line in raw.splitlines():
-        if line.startswith("__COMMIT__\x1f"):
+    marker_len = len(COMMIT_MARKER)
+    for line in lines:
+        if line.startswith(COMMIT_MARKER):
             if current is not None:
-                commits.append(current)
-            subject = line.split("\x1f", 1)[1].strip()
+                yield current
+            timestamp, _, subject = line[marker_len:].partition("\x1f")
             parsed = parse_commit_subject(subject)
             current = {
                 "type": parsed["type"],
                 "message": parsed["message"],
+                "timestamp": int(timestamp),
                 "files_changed": 0,
             }
             continue
 
-        if not line.strip():
-            continue
-
         if current is None:
             continue
 
-        parts = line.split("\t")
-        if len(parts) >= 3:
-            current["files_changed"] += 1
+        match = SHORTSTAT_RE.match(line)
+        if match:
+            current["files_changed"] = int(match.group(1))
 
     if current is not None:
-        commits.append(current)
+        yield current
 
-    return commits
 
+def is_git_work_tree(abs_path):
+    # A stat walk up to the filesystem root is far cheaper than spawning git
+    # just to learn that a configured path is not a repository. ".git" may be
+    # a directory or, for worktrees and submodules, a file. A directory with
+    # HEAD and objects/ is a git dir itself, e.g. a bare clone.
+    if os.environ.get("GIT_DIR"):
+        return True
+    path = abs_path
+    while True:
+        if os.path.exists(os.path.join(path, ".git")):
+            return True
+        if os.path.isfile(os.path.join(path, "HEAD")) and os.path.isdir(
+            os.path.join(path, "objects")
+        ):
+            return True
+        parent = os.path.dirname(path)
+        if parent == path:
+            return False
+        path = parent
 
-def get_repo_summary(repo_path):
-    abs_path = os.path.abspath(repo_path)
-    repo_name = os.path.basename(abs_path.rstrip("\\/")) or abs_path
+
+def get_head_sha(abs_path):
+    # Returns (sha, stderr). The stderr of this small capture is where
+    # repo-level failures such as safe.directory rejections are detected,
+    # so the streamed git log below never has to pipe its stderr.
     try:
         result = subprocess.run(
-            [
-                "git",
-                "-C",
-                abs_path,
-                "log",
-                "--since=24 hours ago",
-                "--no-merges",
-                "--pretty=format:__COMMIT__%x1f%s",
-                "--numstat",
-            ],
+            ["git", "-C", abs_path, "rev-parse", "HEAD"],
             capture_output=True,
             text=True,
         )
-        if result.returncode != 0:
-            stderr = (result.stderr or "") + "\n" + (result.stdout or "")
-            if "detected dubious ownership in repository" in stderr.lower():
-                return {
-                    "error": "dubious_ownership",
-                    "path": abs_path,
-                    "fix": f'git config --global --add safe.directory "{abs_path}"',
-                }
+    except FileNotFoundError:
+        return None, ""
+    if result.returncode != 0:
+        return None, result.stderr or ""
+    return result.stdout.strip() or None, ""
+
+
+def get_cache_path(abs_path):
+    import hashlib
+
+    digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json")
+
+
+def load_cached_commits(abs_path, head, stats):
+    import json
+
+    try:
+        with open(get_cache_path(abs_path), "r", encoding="utf-8") as handle:
+            entry = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    commits = entry.get("commits")
+    if (
+        entry.get("version") != CACHE_VERSION
+        or entry.get("head") != head
+        or entry.get("stats") != stats
+        or not isinstance(commits, list)
+    ):
+        return None
+    # With HEAD unchanged the only difference from a fresh scan is that the
+    # rolling --since window has moved, so drop commits that fell out of it.
+    # A malformed entry is treated as a miss and the repo is rescanned.
+    cutoff = time.time() - SINCE_SECONDS
+    try:
+        if not all(c.keys() >= CACHE_COMMIT_KEYS for c in commits):
             return None
-        commits = parse_git_log_with_numstat(result.stdout.strip())
+        return [c for c in commits if c["timestamp"] >= cutoff]
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def save_cached_commits(abs_path, head, stats, commits):
+    import json
+    import tempfile
+
+    entry = {
+        "version": CACHE_VERSION,
+        "head": head,
+        "stats": stats,
+        "commits": commits,
+    }
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entry, handle)
+            os.replace(tmp_path, get_cache_path(abs_path))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def build_repo_summary(abs_path, commits, stats):
+    return {
+        "name": os.path.basename(abs_path.rstrip("\\/")) or abs_path,
+        "path": abs_path,
+        "commits": commits,
+        "commit_count": len(commits),
+        "files_changed": sum(c["files_changed"] for c in commits) if stats else None,
+    }
+
+
+def get_repo_summary(repo_path, stats=True):
+    abs_path = os.path.abspath(repo_path)
+    if not is_git_work_tree(abs_path):
+        return None
+    head, stderr = get_head_sha(abs_path)
+    if "detected dubious ownership in repository" in stderr.lower():
         return {
-            "name": repo_name,
+            "error": "dubious_ownership",
             "path": abs_path,
-            "commits": commits,
-            "commit_count": len(commits),
-            "files_changed": sum(c["files_changed"] for c in commits),
+            "fix": f'git config --global --add safe.directory "{abs_path}"',
         }
+    if head:
+        commits = load_cached_commits(abs_path, head, stats)
+        if commits is not None:
+            return build_repo_summary(abs_path, commits, stats)
+    args = [
+        "git",
+        "-C",
+        abs_path,
+        "log",
+        f"--since={SINCE_SECONDS} seconds ago",
+        "--no-merges",
+        "--pretty=format:__COMMIT__%x1f%ct%x1f%s",
+    ]
+    if stats:
+        args.append("--shortstat")
+    try:
+        with subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ) as proc:
+            commits = list(parse_git_log_with_shortstat(proc.stdout))
+        if proc.returncode != 0:
+            return None
+        if head:
+            save_cached_commits(abs_path, head, stats, commits)
+        return build_repo_summary(abs_path, commits, stats)
     except FileNotFoundError:
         return None
 
 
 def summarize_commits(commits):
     if not commits:
-        return ["No commits in the last 24 hours"]
-
-    seen = set()
-    grouped = {k: [] for k in TYPE_ORDER}
+        return [("text", "No commits in the last 24 hours")]
 
+    # First occurrence of each message wins, regardless of its type.
+    unique = {}
     for commit in commits:
-        message = commit["message"]
-        key = message.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        ctype = commit["type"] if commit["type"] in grouped else "other"
-        grouped[ctype].append(message)
+        unique.setdefault(commit["message"].lower(), commit)
+
+    grouped = {k: [] for k in TYPE_ORDER}
+    for commit in unique.values():
+        ctype = commit["type"]
+        grouped[ctype if ctype in TYPE_SET else "other"].append(commit["message"])
 
     lines = []
-    for ctype in TYPE_ORDER:
+    for ctype, label in TYPE_TABLE:
         items = grouped[ctype]
         if not items:
             continue
-        lines.append(f"{TYPE_LABELS.get(ctype, 'Other')}:")
+        lines.append(("heading", f"{label}:"))
         for item in items:
-            lines.append(f"- {item}")
+            lines.append(("item", item))
     return lines
 
 
 def format_output(repo_summaries, today, blockers, fmt, team=None):
+    # Each entry is (kind, text) with kind one of "heading", "item", "text"
+    # or "blank"; the format branches below pick the markup per kind.
     repo_lines = []
     if not repo_summaries:
-        repo_lines.append("No repositories scanned")
-    for repo in repo_summaries:
-        repo_lines.append(
-            f"{repo['name']} ({repo['commit_count']} commits, {repo['files_changed']} files changed):"
-        )
+        repo_lines.append(("text", "No repositories scanned"))
+    for index, repo in enumerate(repo_summaries):
+        if index:
+            repo_lines.append(("blank", ""))
+        counts = f"{repo['commit_count']} commits"
+        if repo["files_changed"] is not None:
+            counts += f", {repo['files_changed']} files changed"
+        repo_lines.append(("heading", f"{repo['name']} ({counts}):"))
         repo_lines.extend(summarize_commits(repo["commits"]))
-        repo_lines.append("")
-    if repo_lines and repo_lines[-1] == "":
-        repo_lines.pop()
+
+    out = []
+    append = out.append
 
     if fmt == "slack":
-        lines = []
         if team:
-            lines.append(f"*Team:* {team}")
-        lines.append("*Yesterday:*")
-        for line in repo_lines:
-            if not line:
-                lines.append("")
-            elif line.endswith(":"):
-                lines.append(f"*{line}*")
+            append(f"*Team:* {team}")
+        append("*Yesterday:*")
+        for kind, text in repo_lines:
+            if kind == "heading":
+                append(f"*{text}*")
+            elif kind == "blank":
+                append("")
             else:
-                lines.append(f"- {line[2:]}" if line.startswith("- ") else f"- {line}")
-        lines.append(f"*Today:* {today}")
-        lines.append(f"*Blockers:* {blockers or 'None'}")
-        return "\n".join(lines)
+                append(f"- {text}")
+        append(f"*Today:* {today}")
+        append(f"*Blockers:* {blockers or 'None'}")
+        return "\n".join(out)
 
     if fmt == "markdown":
-        lines = ["### Daily Standup", ""]
+        append("### Daily Standup")
+        append("")
+        if team:
+            append("**Team:**")
+            append(team)
+            append("")
+        append("**Yesterday:**")
+    else:
         if team:
-            lines.extend(["**Team:**", team, ""])
-        lines.append("**Yesterday:**")
-        for line in repo_lines:
-            lines.append(line)
-        lines.extend(["", "**Today:**", today, "", "**Blockers:**", blockers or "None"])
-        return "\n".join(lines)
+            append(f"Team: {team}")
+        append("Yesterday:")
+
+    for kind, text in repo_lines:
+        append(f"- {text}" if kind == "item" else text)
+
+    if fmt == "markdown":
+        out.extend(["", "**Today:**", today, "", "**Blockers:**", blockers or "None"])
+    else:
+        append(f"Today: {today}")
+        append(f"Blockers: {blockers or 'None'}")
+    return "\n".join(out)
 
-    lines = []
-    if team:
-        lines.append(f"Team: {team}")
-    lines.append("Yesterday:")
-    lines.extend(repo_lines)
-    lines.append(f"Today: {today}")
-    lines.append(f"Blockers: {blockers or 'None'}")
-    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=1)
+def get_clipboard_command():
+    import shutil
+
+    if sys.platform.startswith("win"):
+        # clip.exe reads the console code page unless the input has a BOM;
+        # the "utf-16" codec writes one in native (little-endian) order.
+        # Windows paste targets expect CRLF line endings.
+        return ("clip",), "utf-16", "\r\n"
+    if sys.platform == "darwin" and shutil.which("pbcopy"):
+        return ("pbcopy",), "utf-8", "\n"
+    if shutil.which("xclip"):
+        return ("xclip", "-selection", "clipboard"), "utf-8", "\n"
+    if shutil.which("xsel"):
+        return ("xsel", "--clipboard", "--input"), "utf-8", "\n"
+    return None
 
 
 def copy_to_clipboard(text):
-    if not text:
+    clipboard = get_clipboard_command()
+    if not text or clipboard is None:
         return False
+    command, encoding, newline = clipboard
+    if newline != "\n":
+        text = text.replace("\n", newline)
     try:
-        if sys.platform.startswith("win"):
-            subprocess.run(["clip"], input=text, text=True, check=True)
-            return True
-        if sys.platform == "darwin" and shutil.which("pbcopy"):
-            subprocess.run(["pbcopy"], input=text, text=True, check=True)
-            return True
-        if shutil.which("xclip"):
-            subprocess.run(
-                ["xclip", "-selection", "clipboard"],
-                input=text,
-                text=True,
-                check=True,
-            )
-            return True
-        if shutil.which("xsel"):
-            subprocess.run(
-                ["xsel", "--clipboard", "--input"], input=text, text=True, check=True
-            )
-            return True
+        subprocess.run(command, input=text.encode(encoding), check=True)
     except Exception:
         return False
-    return False
+    return True
+
+
+def write_lines(lines):
+    # One write and flush per batch of lines instead of a print() per line.
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    lines.clear()
 
 
 def collect_repo_paths(config, cli_repos):
-    source = cli_repos if cli_repos else config.get("repos") or [os.getcwd()]
-    seen = set()
-    ordered = []
+    cwd = os.getcwd()
+    source = cli_repos if cli_repos else config.get("repos") or [cwd]
+    # normcase folds case only on Windows; POSIX paths differing in case
+    # are distinct directories.
+    unique = {}
     for repo in source:
-        abs_path = os.path.abspath(repo)
-        key = abs_path.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        ordered.append(abs_path)
-    return ordered
+        abs_path = os.path.normpath(os.path.join(cwd, repo))
+        unique.setdefault(os.path.normcase(abs_path), abs_path)
+    return list(unique.values())
 
 
 def main():
@@ -342,23 +532,48 @@ def main():
         help="Repository path to scan (repeatable). Defaults to cwd or .standuprc repos.",
     )
     parser.add_argument("--no-copy", action="store_true", help="Disable clipboard auto-copy")
+    parser.add_argument(
+        "--stats",
+        dest="stats",
+        action="store_true",
+        default=None,
+        help="Count files changed per repository (default)",
+    )
+    parser.add_argument(
+        "--no-stats",
+        dest="stats",
+        action="store_false",
+        help="Skip files-changed counting for a faster scan",
+    )
     args = parser.parse_args()
 
     fmt = args.format or config.get("format") or "plain"
     team = args.team or config.get("team")
     copy_enabled = (not args.no_copy) and config.get("copy", True)
+    stats_enabled = args.stats if args.stats is not None else config.get("stats", True)
     repo_paths = collect_repo_paths(config, args.repo)
 
-    print()
-    print(paint(BOLD + CYAN, "  standup-cli"))
-    print(paint(GRAY, "  Generate your daily standup in seconds\n"))
+    buf = ["", BANNER, TAGLINE, SCANNING]
+    write_lines(buf)
 
-    print(paint(DIM, "  Scanning git commits from last 24hrs..."))
     repo_summaries = []
     skipped = []
     dubious = []
-    for repo_path in repo_paths:
-        summary = get_repo_summary(repo_path)
+    if len(repo_paths) > 1:
+        # The thread pool only pays for its import with more than one repo.
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(repo_paths))
+        ) as executor:
+            futures = [
+                executor.submit(get_repo_summary, path, stats_enabled) for path in repo_paths
+            ]
+            summaries = [future.result() for future in futures]
+    else:
+        summaries = [get_repo_summary(path, stats_enabled) for path in repo_paths]
+
+    for repo_path, summary in zip(repo_paths, summaries):
         if summary is None:
             skipped.append(repo_path)
             continue
@@ -369,31 +584,25 @@ def main():
                 skipped.append(repo_path)
             continue
         repo_summaries.append(summary)
-        print(
-            paint(
-                GREEN,
-                f"  {summary['name']}: {summary['commit_count']} commit(s), "
-                f"{summary['files_changed']} file(s) changed",
-            )
-        )
+        line = f"  {summary['name']}: {summary['commit_count']} commit(s)"
+        if summary["files_changed"] is not None:
+            line += f", {summary['files_changed']} file(s) changed"
+        buf.append(paint(GREEN, line))
 
     for issue in dubious:
-        print(
-            paint(
-                YELLOW,
-                f"  Warning: Git safe.directory blocked repo {issue['path']}",
-            )
+        buf.append(
+            paint(YELLOW, f"  Warning: Git safe.directory blocked repo {issue['path']}")
         )
-        print(paint(YELLOW, f"  Run: {issue['fix']}"))
-    if skipped:
-        for repo_path in skipped:
-            print(paint(YELLOW, f"  Warning: skipped non-git repo {repo_path}"))
-    print()
+        buf.append(paint(YELLOW, f"  Run: {issue['fix']}"))
+    for repo_path in skipped:
+        buf.append(paint(YELLOW, f"  Warning: skipped non-git repo {repo_path}"))
+    buf.append("")
+    write_lines(buf)
 
-    today = input(paint(BOLD, '  What are you working on today?\n  ') + "> ").strip()
-    print()
-    blockers = input(paint(BOLD, '  Any blockers? (press Enter for "None")\n  ') + "> ").strip()
-    print()
+    today = input(TODAY_PROMPT).strip()
+    buf.append("")
+    write_lines(buf)
+    blockers = input(BLOCKERS_PROMPT).strip()
 
     output = format_output(
         repo_summaries,
@@ -403,25 +612,19 @@ def main():
         team=team,
     )
 
-    divider = paint(GRAY, "  " + "-" * 50)
     fmt_label = paint(MAGENTA, f"[{fmt}]")
 
-    print(divider)
-    print(paint(BOLD + GREEN, f"  Your Standup {fmt_label}\n"))
-    for line in output.split("\n"):
-        print("  " + line)
-    print()
-    print(divider)
-    print()
-    print(paint(GRAY, "  Tip: use --format slack | markdown | plain"))
-    print()
-
+    buf.append("")
+    buf.append(DIVIDER)
+    buf.append(paint(BOLD + GREEN, f"  Your Standup {fmt_label}\n"))
+    buf.append("  " + output.replace("\n", "\n  "))
+    buf.extend(["", DIVIDER, "", TIP, ""])
+    # Copy before rendering so everything after the prompts goes out in a
+    # single write.
     if copy_enabled:
-        if copy_to_clipboard(output):
-            print(paint(GREEN, "  Copied standup to clipboard"))
-        else:
-            print(paint(YELLOW, "  Warning: clipboard copy unavailable"))
-        print()
+        buf.append(COPIED if copy_to_clipboard(output) else COPY_UNAVAILABLE)
+        buf.append("")
+    write_lines(buf)
 
 
 if __name__ == "__main__":